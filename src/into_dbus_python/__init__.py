@@ -18,4 +18,4 @@ Top-level file for xformer.
 from ._errors import IntoDPError
 from ._signature import signature
 from ._version import __version__
-from ._xformer import xformer, xformers
+from ._xformer import xformer, xformer_raw, xformers, xformers_raw
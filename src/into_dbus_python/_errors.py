@@ -66,7 +66,7 @@ class IntoDPSurprisingError(IntoDPRuntimeError):
     libraries.
     """
 
-    def __init__(self, message, value):  # pragma: no cover
+    def __init__(self, message, value):
         """
         Initializer.
 
@@ -80,6 +80,9 @@ class IntoDPSurprisingError(IntoDPRuntimeError):
 class IntoDPSignatureError(IntoDPError):
     """
     Exception raised when a value does not seem to have a valid signature.
+
+    The problematic value, which may be large, is only formatted into the
+    message when the exception itself is formatted.
     """
 
     def __init__(self, message, value):
@@ -91,3 +94,6 @@ class IntoDPSignatureError(IntoDPError):
         """
         super().__init__(message)
         self.value = value
+
+    def __str__(self):
+        return f"{self.args[0]}: {self.value}"
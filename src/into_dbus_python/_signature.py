@@ -15,124 +15,172 @@
 Definition of signature method.
 """
 
+# isort: STDLIB
+import functools
+
 # isort: THIRDPARTY
 import dbus
 
 from ._errors import IntoDPSignatureError
 
+_ARRAY = dbus.Array
+_DICTIONARY = dbus.Dictionary
+_STRUCT = dbus.Struct
+
+# Signature characters for the dbus-python basic types, keyed by type, so
+# that the signature of a basic value can be found with a single lookup.
+_SIG_MAP = {
+    dbus.Boolean: "b",
+    dbus.Byte: "y",
+    dbus.Double: "d",
+    dbus.Int16: "n",
+    dbus.Int32: "i",
+    dbus.Int64: "x",
+    dbus.ObjectPath: "o",
+    dbus.Signature: "g",
+    dbus.String: "s",
+    dbus.UInt16: "q",
+    dbus.UInt32: "u",
+    dbus.UInt64: "t",
+    dbus.types.UnixFd: "h",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _subclass_signature(klass):
+    """
+    Get the signature of a subclass of a dbus-python basic type.
 
-def signature(dbus_object, *, unpack=False):
+    :param type klass: the type of the object
+    :returns: the corresponding signature or None if none is found
+    :rtype: str or NoneType
     """
-    Get the signature of a dbus object.
+    for base, sig in _SIG_MAP.items():
+        if issubclass(klass, base):
+            return sig
+    return None
+
+
+def _signature_packed(dbus_object):
+    """
+    Get the signature of a dbus object, "v" if it inhabits a variant type.
 
     :param dbus_object: the object
     :type dbus_object: a dbus object
-    :param bool unpack: if True, unpack from enclosing variant type
     :returns: the corresponding signature
     :rtype: str
     """
-    # pylint: disable=too-many-return-statements
-    # pylint: disable=too-many-branches
-
     # The object passed may not be a dbus object, and consequently may not
     # have a variant_level attribute.
-    if not hasattr(dbus_object, "variant_level"):
+    try:
+        variant_level = dbus_object.variant_level
+    except AttributeError as err:
         raise IntoDPSignatureError(
             (
                 "value does not have a variant_level attribute, "
                 "can not determine the correct signature"
             ),
             dbus_object,
-        )
+        ) from err
 
-    if dbus_object.variant_level != 0 and not unpack:
+    if variant_level != 0:
         return "v"
 
-    if isinstance(dbus_object, dbus.Array):
-        sigs = frozenset(signature(x) for x in dbus_object)
-        len_sigs = len(sigs)
-        if len_sigs > 1:
-            raise IntoDPSignatureError(
-                f"the dbus-python Array object {dbus_object} has items with varying signatures",
-                dbus_object,
-            )
-
-        if len_sigs == 0:
-            return "a" + dbus_object.signature
-
-        return "a" + list(sigs)[0]
+    return _signature_unpacked(dbus_object)
 
-    if isinstance(dbus_object, dbus.Struct):
-        sigs = (signature(x) for x in dbus_object)
-        return "(" + "".join(x for x in sigs) + ")"
 
-    if isinstance(dbus_object, dbus.Dictionary):
-        key_sigs = frozenset(signature(x) for x in dbus_object.keys())
-        value_sigs = frozenset(signature(x) for x in dbus_object.values())
-
-        len_key_sigs = len(key_sigs)
-        len_value_sigs = len(value_sigs)
+def _signature_unpacked(dbus_object):
+    """
+    Get the signature of a dbus object, unpacked from any enclosing variant.
 
-        if len_key_sigs != len_value_sigs:
-            # It seems impossible to force a dbus-python Dictionary value
-            # to have this property; the Dictionary constructor prevents it.
-            raise IntoDPSignatureError(
-                f"the dbus-python Dictionary object {dbus_object} "
-                f"does not have a valid signature",
-                dbus_object,
-            )  # pragma: no cover
+    :param dbus_object: the object
+    :type dbus_object: a dbus object
+    :returns: the corresponding signature
+    :rtype: str
+    """
+    # pylint: disable=too-many-return-statements
+    # pylint: disable=too-many-branches
 
-        if len_key_sigs > 1:
-            # It seems impossible to force a dbus-python Dictionary value
-            # to have this property; the Dictionary constructor prevents it.
+    # Most values are of basic types, so look for those first.
+    klass = type(dbus_object)
+    sig = _SIG_MAP.get(klass)
+    if sig is not None:
+        return sig
+
+    if klass is _ARRAY or isinstance(dbus_object, _ARRAY):
+        if len(dbus_object) == 0:
+            if dbus_object.signature is None:
+                raise IntoDPSignatureError(
+                    "the empty dbus-python Array object has no signature",
+                    dbus_object,
+                )
+            return f"a{dbus_object.signature}"
+
+        # dbus-python does not require that the items of an Array have the
+        # same signature, so each item is checked against the first.
+        items = iter(dbus_object)
+        first_sig = _signature_packed(next(items))
+        if any(_signature_packed(x) != first_sig for x in items):
             raise IntoDPSignatureError(
-                f"the dbus-python Dictionary object {dbus_object} "
-                f"has different signatures for different keys",
+                "the dbus-python Array object has items with varying signatures",
                 dbus_object,
-            )  # pragma: no cover
-
-        if len_key_sigs == 0:
-            return "a{" + dbus_object.signature + "}"
-
-        return "a{" + list(key_sigs)[0] + list(value_sigs)[0] + "}"
-
-    if isinstance(dbus_object, dbus.Boolean):
-        return "b"
-
-    if isinstance(dbus_object, dbus.Byte):
-        return "y"
-
-    if isinstance(dbus_object, dbus.Double):
-        return "d"
-
-    if isinstance(dbus_object, dbus.Int16):
-        return "n"
-
-    if isinstance(dbus_object, dbus.Int32):
-        return "i"
-
-    if isinstance(dbus_object, dbus.Int64):
-        return "x"
-
-    if isinstance(dbus_object, dbus.ObjectPath):
-        return "o"
-
-    if isinstance(dbus_object, dbus.Signature):
-        return "g"
-
-    if isinstance(dbus_object, dbus.String):
-        return "s"
+            )
 
-    if isinstance(dbus_object, dbus.UInt16):
-        return "q"
+        return f"a{first_sig}"
+
+    if klass is _STRUCT or isinstance(dbus_object, _STRUCT):
+        field_sigs = "".join([_signature_packed(x) for x in dbus_object])
+        return f"({field_sigs})"
+
+    if klass is _DICTIONARY or isinstance(dbus_object, _DICTIONARY):
+        if len(dbus_object) == 0:
+            if dbus_object.signature is None:
+                raise IntoDPSignatureError(
+                    "the empty dbus-python Dictionary object has no signature",
+                    dbus_object,
+                )
+            return f"a{{{dbus_object.signature}}}"
+
+        items = iter(dbus_object.items())
+        (key, value) = next(items)
+        key_sig = _signature_packed(key)
+        value_sig = _signature_packed(value)
+
+        for key, value in items:
+            if _signature_packed(key) != key_sig:
+                raise IntoDPSignatureError(
+                    "the dbus-python Dictionary object "
+                    "has different signatures for different keys",
+                    dbus_object,
+                )
+
+            if _signature_packed(value) != value_sig:
+                raise IntoDPSignatureError(
+                    "the dbus-python Dictionary object "
+                    "has different signatures for different values",
+                    dbus_object,
+                )
+
+        return f"a{{{key_sig}{value_sig}}}"
+
+    # The object may be an instance of a subclass of a dbus-python type.
+    sig = _subclass_signature(klass)
+    if sig is not None:
+        return sig
 
-    if isinstance(dbus_object, dbus.UInt32):
-        return "u"
+    raise IntoDPSignatureError("object is not a dbus-python object type", dbus_object)
 
-    if isinstance(dbus_object, dbus.UInt64):
-        return "t"
 
-    if isinstance(dbus_object, dbus.types.UnixFd):  # pragma: no cover
-        return "h"
+def signature(dbus_object, *, unpack=False):
+    """
+    Get the signature of a dbus object.
 
-    raise IntoDPSignatureError("object is not a dbus-python object type", dbus_object)
+    :param dbus_object: the object
+    :type dbus_object: a dbus object
+    :param bool unpack: if True, unpack from enclosing variant type
+    :returns: the corresponding signature
+    :rtype: str
+    """
+    if unpack:
+        return _signature_unpacked(dbus_object)
+    return _signature_packed(dbus_object)
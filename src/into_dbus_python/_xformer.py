@@ -17,6 +17,7 @@ Transforming Python basic types to Python dbus types.
 
 # isort: STDLIB
 import functools
+import sys
 from collections.abc import Sequence
 from typing import Any
 
@@ -33,6 +34,31 @@ from ._errors import (
     IntoDPUnexpectedValueError,
 )
 
+_ARRAY = dbus.types.Array
+_DICTIONARY = dbus.types.Dictionary
+_STRUCT = dbus.types.Struct
+
+# The types of sequence most commonly passed for arrays and structs, which
+# can be recognized without the comparatively slow Sequence ABC check.
+_SEQUENCES = (list, tuple)
+
+# The dbus-python classes for the basic types, keyed by type code.
+_BASIC_KLASSES = {
+    "b": dbus.types.Boolean,
+    "d": dbus.types.Double,
+    "g": dbus.types.Signature,
+    "h": dbus.types.UnixFd,
+    "i": dbus.types.Int32,
+    "n": dbus.types.Int16,
+    "o": dbus.types.ObjectPath,
+    "q": dbus.types.UInt16,
+    "s": dbus.types.String,
+    "t": dbus.types.UInt64,
+    "u": dbus.types.UInt32,
+    "x": dbus.types.Int64,
+    "y": dbus.types.Byte,
+}
+
 
 def _wrapper(func):
     """
@@ -52,12 +78,9 @@ def _wrapper(func):
         """
         try:
             return func(expr, variant=variant)
-        # Allow KeyboardInterrupt error to be propagated
-        except KeyboardInterrupt as err:  # pragma: no cover
-            raise err
-        except IntoDPError as err:
-            raise err
-        except BaseException as err:  # pragma: no cover
+        except IntoDPError:
+            raise
+        except Exception as err:  # pragma: no cover
             raise IntoDPSurprisingError(
                 "encountered a surprising error while transforming some expression",
                 expr,
@@ -66,6 +89,35 @@ def _wrapper(func):
     return the_func
 
 
+def _list_wrapper(func):
+    """
+    Wraps a function returned by _xformer() so that it catches all unexpected
+    errors and raises IntoDPSurprisingErrors.
+
+    :param func: the function transforming a list of objects
+    """
+
+    @functools.wraps(func)
+    def the_func(objects):
+        """
+        The actual function.
+
+        :param objects: the objects to be xformed to dbus-python types
+        :type objects: list of object
+        """
+        try:
+            return func(objects)
+        except IntoDPError:
+            raise
+        except Exception as err:
+            raise IntoDPSurprisingError(
+                "encountered a surprising error while transforming some expression",
+                objects,
+            ) from err
+
+    return the_func
+
+
 class _ToDbusXformer(Parser):
     """
     Class which extends a Parser to yield a function that yields
@@ -80,7 +132,8 @@ class _ToDbusXformer(Parser):
 
     # pylint: disable=too-few-public-methods
 
-    def _handle_variant(self):
+    @staticmethod
+    def _handle_variant():
         """
         Generate the correct function for a variant signature.
 
@@ -100,15 +153,11 @@ class _ToDbusXformer(Parser):
             """
             try:
                 (signature, an_obj) = a_tuple
-                (func, sig) = self.COMPLETE.parseString(signature)[0]
-            # Allow KeyboardInterrupt error to be propagated
-            except KeyboardInterrupt as err:  # pragma: no cover
-                raise err
-            except BaseException as err:
+                (func, _) = _compile_variant(signature)
+            except Exception as err:
                 raise IntoDPUnexpectedValueError(
                     "inappropriate argument or signature for variant type", a_tuple
                 ) from err
-            assert sig == signature
             return func(an_obj, variant=variant + 1)
 
         return (the_func, "v")
@@ -125,8 +174,9 @@ class _ToDbusXformer(Parser):
 
         if len(toks) == 5 and toks[1] == "{" and toks[4] == "}":
             subtree = toks[2:4]
-            signature = "".join(s for (_, s) in subtree)
+            signature = sys.intern("".join(s for (_, s) in subtree))
             [key_func, value_func] = [f for (f, _) in subtree]
+            [key_klass, value_klass] = [_BASIC_KLASSES.get(s) for (_, s) in subtree]
 
             def the_dict_func(a_dict, *, variant=0):
                 """
@@ -139,15 +189,29 @@ class _ToDbusXformer(Parser):
                 :returns: a dbus dictionary of transformed values
                 :rtype: Dictionary
                 """
-                elements = [(key_func(x), value_func(y)) for (x, y) in a_dict.items()]
-                return dbus.types.Dictionary(
-                    elements, signature=signature, variant_level=variant
-                )
-
-            return (the_dict_func, "a{" + signature + "}")
+                if key_klass is None or value_klass is None:
+                    elements = [
+                        (key_func(x), value_func(y)) for (x, y) in a_dict.items()
+                    ]
+                else:
+                    # The keys and values are of a basic type, so construct
+                    # them directly, leaving it to key_func and value_func to
+                    # raise the appropriate error if a value is inappropriate.
+                    try:
+                        elements = [
+                            (key_klass(x), value_klass(y)) for (x, y) in a_dict.items()
+                        ]
+                    except Exception:  # pylint: disable=broad-except
+                        elements = [
+                            (key_func(x), value_func(y)) for (x, y) in a_dict.items()
+                        ]
+                return _DICTIONARY(elements, signature=signature, variant_level=variant)
+
+            return (the_dict_func, sys.intern("a{" + signature + "}"))
 
         if len(toks) == 2:
             (func, sig) = toks[1]
+            klass = _BASIC_KLASSES.get(sig)
 
             def the_array_func(a_list: Sequence[Any], *, variant=0):
                 """
@@ -159,16 +223,25 @@ class _ToDbusXformer(Parser):
                 :returns: a dbus Array of transformed values
                 :rtype: Array
                 """
-                if not isinstance(a_list, Sequence):
+                if type(a_list) not in _SEQUENCES and not isinstance(a_list, Sequence):
                     raise IntoDPUnexpectedValueError(
                         f"expected a list for an array but found something else: {a_list}",
                         a_list,
                     )
-                elements = [func(x) for x in a_list]
+                if klass is None:
+                    elements = [func(x) for x in a_list]
+                else:
+                    # The elements are of a basic type, so construct them
+                    # directly, leaving it to func to raise the appropriate
+                    # error if a value is inappropriate.
+                    try:
+                        elements = [klass(x) for x in a_list]
+                    except Exception:  # pylint: disable=broad-except
+                        elements = [func(x) for x in a_list]
 
-                return dbus.types.Array(elements, signature=sig, variant_level=variant)
+                return _ARRAY(elements, signature=sig, variant_level=variant)
 
-            return (the_array_func, "a" + sig)
+            return (the_array_func, sys.intern("a" + sig))
 
         # This should be impossible, because a parser error is raised on
         # an unexpected token before the handler is invoked.
@@ -186,8 +259,9 @@ class _ToDbusXformer(Parser):
         :rtype: ((list or tuple) -> (Struct * int)) * str
         """
         subtrees = toks[1:-1]
-        signature = "".join(s for (_, s) in subtrees)
+        signature = sys.intern("".join(s for (_, s) in subtrees))
         funcs = [f for (f, _) in subtrees]
+        num_funcs = len(funcs)
 
         def the_func(a_list: Sequence[Any], *, variant=0):
             """
@@ -200,24 +274,22 @@ class _ToDbusXformer(Parser):
             :rtype: Struct
             :raises IntoDPRuntimeError:
             """
-            if not isinstance(a_list, Sequence):
+            if type(a_list) not in _SEQUENCES and not isinstance(a_list, Sequence):
                 raise IntoDPUnexpectedValueError(
                     f"expected a simple sequence for the fields of a struct "
                     f"but found something else: {a_list}",
                     a_list,
                 )
-            if len(a_list) != len(funcs):
+            if len(a_list) != num_funcs:
                 raise IntoDPUnexpectedValueError(
-                    f"expected {len(funcs)} elements for a struct, "
+                    f"expected {num_funcs} elements for a struct, "
                     f"but found {len(a_list)}",
                     a_list,
                 )
             elements = [f(x) for (f, x) in zip(funcs, a_list)]
-            return dbus.types.Struct(
-                elements, signature=signature, variant_level=variant
-            )
+            return _STRUCT(elements, signature=signature, variant_level=variant)
 
-        return (the_func, "(" + signature + ")")
+        return (the_func, sys.intern("(" + signature + ")"))
 
     @staticmethod
     def _handle_base_case(klass, symbol):
@@ -237,11 +309,10 @@ class _ToDbusXformer(Parser):
             :rtype: dbus-python object
             """
             try:
+                if variant == 0:
+                    return klass(value)
                 return klass(value, variant_level=variant)
-            # Allow KeyboardInterrupt error to be propagated
-            except KeyboardInterrupt as err:  # pragma: no cover
-                raise err
-            except BaseException as err:
+            except Exception as err:
                 raise IntoDPUnexpectedValueError(
                     "inappropriate value passed to dbus-python constructor", value
                 ) from err
@@ -289,7 +360,7 @@ class _ToDbusXformer(Parser):
             _ToDbusXformer._handle_base_case(dbus.types.Signature, "g")
         )
 
-        self.VARIANT.setParseAction(self._handle_variant)
+        self.VARIANT.setParseAction(_ToDbusXformer._handle_variant)
 
         self.ARRAY.setParseAction(  # pyright: ignore [ reportOptionalMemberAccess ]
             _ToDbusXformer._handle_array
@@ -303,29 +374,63 @@ class _ToDbusXformer(Parser):
 _XFORMER = _ToDbusXformer()
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_variant(signature):
+    """
+    Get the xformer function for the signature of a variant's value.
+
+    The result is cached, since the values of variants are generally drawn
+    from a small set of signatures.
+
+    :param str signature: the signature of a single complete type
+    :returns: the xformer function and the signature it matches
+    :rtype: tuple of a function * str
+    """
+    return _XFORMER.COMPLETE.parseString(signature, parseAll=True)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def xformers_raw(sig):
+    """
+    Get the unwrapped xformer functions for the given signature.
+
+    Unlike the functions returned by xformers(), these do not convert
+    unexpected exceptions to IntoDPSurprisingError, and so avoid an extra
+    function call per transformation.
+
+    The result is cached, so each distinct signature is parsed only once.
+
+    :param str sig: a signature
+    :returns: the xformer functions for the given signature.
+    :rtype: tuple of tuple of a function * str
+    """
+    return tuple(_XFORMER.PARSER.parseString(sig, parseAll=True))
+
+
+@functools.lru_cache(maxsize=None)
 def xformers(sig):
     """
-    Get the list of xformer functions for the given signature.
+    Get the xformer functions for the given signature.
+
+    The result is cached, so each distinct signature is parsed only once.
 
     :param str sig: a signature
-    :returns: a list of xformer functions for the given signature.
-    :rtype: list of tuple of a function * str
+    :returns: the xformer functions for the given signature.
+    :rtype: tuple of tuple of a function * str
     """
-    return [
-        (_wrapper(f), l) for (f, l) in _XFORMER.PARSER.parseString(sig, parseAll=True)
-    ]
+    return tuple((_wrapper(f), l) for (f, l) in xformers_raw(sig))
 
 
-def xformer(signature):
+def _xformer(funcs):
     """
-    Returns a transformer function for the given signature.
+    Returns a transformer function that applies the given xformer functions.
 
-    :param str signature: a dbus signature
+    :param funcs: the xformer functions, one for each complete type
+    :type funcs: list of function
     :returns: a function to transform a list of objects to inhabit the signature
     :rtype: (list of object) -> (list of object)
     """
-
-    funcs = [f for (f, _) in xformers(signature)]
+    num_funcs = len(funcs)
 
     def the_func(objects):
         """
@@ -337,11 +442,48 @@ def xformer(signature):
         :returns: transformed objects
         :rtype: list of object (in dbus types)
         """
-        if len(objects) != len(funcs):
+        if type(objects) not in _SEQUENCES and not isinstance(objects, Sequence):
+            raise IntoDPUnexpectedValueError(
+                f"expected a list of items to transform but found something else: "
+                f"{objects}",
+                objects,
+            )
+        if len(objects) != num_funcs:
             raise IntoDPUnexpectedValueError(
-                f"expected {len(funcs)} items to transform but found {len(objects)}",
+                f"expected {num_funcs} items to transform but found {len(objects)}",
                 objects,
             )
         return [f(a) for (f, a) in zip(funcs, objects)]
 
     return the_func
+
+
+@functools.lru_cache(maxsize=None)
+def xformer_raw(signature):
+    """
+    Returns an unwrapped transformer function for the given signature.
+
+    Like xformers_raw(), the function does not convert unexpected exceptions
+    to IntoDPSurprisingError.
+
+    The result is cached, so each distinct signature is parsed only once.
+
+    :param str signature: a dbus signature
+    :returns: a function to transform a list of objects to inhabit the signature
+    :rtype: (list of object) -> (list of object)
+    """
+    return _xformer([f for (f, _) in xformers_raw(signature)])
+
+
+@functools.lru_cache(maxsize=None)
+def xformer(signature):
+    """
+    Returns a transformer function for the given signature.
+
+    The result is cached, so each distinct signature is parsed only once.
+
+    :param str signature: a dbus signature
+    :returns: a function to transform a list of objects to inhabit the signature
+    :rtype: (list of object) -> (list of object)
+    """
+    return _list_wrapper(xformer_raw(signature))
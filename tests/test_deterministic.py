@@ -22,8 +22,12 @@ import unittest
 import dbus
 
 # isort: LOCAL
-from into_dbus_python import signature, xformer
-from into_dbus_python._errors import IntoDPSignatureError, IntoDPUnexpectedValueError
+from into_dbus_python import signature, xformer, xformer_raw, xformers, xformers_raw
+from into_dbus_python._errors import (
+    IntoDPSignatureError,
+    IntoDPSurprisingError,
+    IntoDPUnexpectedValueError,
+)
 
 
 class ParseTestCase(unittest.TestCase):
@@ -38,6 +42,14 @@ class ParseTestCase(unittest.TestCase):
         with self.assertRaises(IntoDPUnexpectedValueError):
             xformer("a(qq)")([{}])
 
+    def test_bad_array_element_value(self):
+        """
+        Verify that an inappropriate value for an element of an array of a
+        basic type will raise an exception.
+        """
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformer("ay")([[0, 256]])
+
     def test_bad_base_case_value(self):
         """
         Verify that transforming a string to a numeric value will raise an
@@ -46,6 +58,39 @@ class ParseTestCase(unittest.TestCase):
         with self.assertRaises(IntoDPUnexpectedValueError):
             xformer("x")(["string"])
 
+    def test_bad_dict_value(self):
+        """
+        Verify that an inappropriate value for a value in a dict of a basic
+        type will raise an exception.
+        """
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformer("a{sy}")([{"zero": 0, "too big": 256}])
+
+    def test_bad_nested_dict_value(self):
+        """
+        Verify that an inappropriate value deep within nested dicts raises an
+        exception without the enclosing dicts transforming their values again.
+        """
+
+        class CountingDict(dict):  # pylint: disable=too-few-public-methods
+            """
+            A dict that counts the number of times its items are requested.
+            """
+
+            count = 0
+
+            def items(self):
+                """
+                Count the request before returning the items.
+                """
+                CountingDict.count += 1
+                return super().items()
+
+        value = {"outer": CountingDict({"middle": {"inner": 256}})}
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformer("a{sa{sa{sy}}}")([value])
+        self.assertEqual(CountingDict.count, 1)
+
     def test_bad_struct_value(self):
         """
         Verify that transforming a dict when a struct is expected fails.
@@ -53,6 +98,79 @@ class ParseTestCase(unittest.TestCase):
         with self.assertRaises(IntoDPUnexpectedValueError):
             xformer("(qq)")(({32: 1, 64: 32},))
 
+    def test_bad_objects(self):
+        """
+        Verify that passing something other than a list of objects to the
+        function returned by xformer() raises an exception.
+        """
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformer("s")(5)
+
+    def test_bad_wrapped_value(self):
+        """
+        Verify that a function returned by xformers() raises an exception
+        for an inappropriate value.
+        """
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformers("y")[0][0](256)
+
+    def test_surprising_error(self):
+        """
+        Verify that an unexpected error raised while transforming a list of
+        objects is converted to an IntoDPSurprisingError.
+        """
+
+        class BadList(list):  # pylint: disable=too-few-public-methods
+            """
+            A list that can not be iterated over.
+            """
+
+            def __iter__(self):
+                """
+                Raise an unexpected error.
+                """
+                raise RuntimeError("can not iterate")
+
+        value = BadList(["string"])
+        with self.assertRaises(IntoDPSurprisingError) as context:
+            xformer("s")(value)
+
+        self.assertIs(context.exception.value, value)
+
+    def test_bad_keyword(self):
+        """
+        Verify that a function returned by xformers() rejects an unknown
+        keyword argument at the call.
+        """
+        with self.assertRaises(TypeError):
+            xformers("s")[0][0]("string", variants=1)
+
+    def test_bad_variant_signature(self):
+        """
+        Verify that a variant signature of more than one complete type will
+        raise an exception.
+        """
+        with self.assertRaises(IntoDPUnexpectedValueError):
+            xformer("v")([("bb", True)])
+
+    def test_cache(self):
+        """
+        Verify that the functions for a signature are only built once.
+        """
+        self.assertIs(xformers("a{sv}"), xformers("a{sv}"))
+        self.assertIs(xformer("a{sv}"), xformer("a{sv}"))
+
+    def test_raw(self):
+        """
+        Verify that the unwrapped functions transform values in the same way
+        as the wrapped ones.
+        """
+        value = [("s", "string"), [True, False]]
+        self.assertEqual(xformer_raw("vab")(value), xformer("vab")(value))
+        self.assertEqual(
+            [l for (_, l) in xformers_raw("vab")], [l for (_, l) in xformers("vab")]
+        )
+
     def test_variant_depth(self):
         """
         Verify that a nested variant has appropriate variant depth.
@@ -119,3 +237,61 @@ class SignatureTestCase(unittest.TestCase):
                 variant_level = 0
 
             signature(TestObject())
+
+    def test_dictionary_varying_signatures(self):
+        """
+        Test that a Dictionary with keys or values of different signatures
+        raises an exception.
+        """
+        with self.assertRaises(IntoDPSignatureError):
+            signature(
+                dbus.Dictionary(
+                    {dbus.String("a"): dbus.Int32(1), dbus.Int32(1): dbus.Int32(2)}
+                )
+            )
+
+        with self.assertRaises(IntoDPSignatureError):
+            signature(
+                dbus.Dictionary(
+                    {dbus.String("a"): dbus.Int32(1), dbus.String("b"): dbus.Byte(2)}
+                )
+            )
+
+    def test_empty_no_signature(self):
+        """
+        Test that an empty Array or Dictionary without a signature raises
+        an exception, since its signature can not be determined.
+        """
+        with self.assertRaises(IntoDPSignatureError):
+            signature(dbus.Array([]))
+
+        with self.assertRaises(IntoDPSignatureError):
+            signature(dbus.Dictionary({}))
+
+        self.assertEqual(signature(dbus.Array([], signature="s")), "as")
+        self.assertEqual(signature(dbus.Dictionary({}, signature="sv")), "a{sv}")
+
+    def test_message(self):
+        """
+        Test that the problematic value is included in the error message.
+        """
+        value = dbus.Array(
+            [dbus.Boolean(False, variant_level=2), dbus.Byte(0)], signature="v"
+        )
+        with self.assertRaises(IntoDPSignatureError) as context:
+            signature(value)
+
+        self.assertIn(str(value), str(context.exception))
+
+    def test_subclass(self):
+        """
+        Test that the signature of an instance of a subclass of a dbus-python
+        basic type is the signature of the dbus-python type.
+        """
+
+        class TestString(dbus.String):  # pylint: disable=too-few-public-methods
+            """
+            A subclass of a dbus-python String.
+            """
+
+        self.assertEqual(signature(TestString("test")), "s")
@@ -16,13 +16,14 @@ Hypothesis-based tests of signature parsing and calculation.
 """
 
 # isort: STDLIB
-import string
+import functools
+import os
 import unittest
-from os import sys
 
 # isort: THIRDPARTY
 import dbus
-from hypothesis import HealthCheck, example, given, settings, strategies
+from hypothesis import HealthCheck, Phase, example, given, settings, strategies
+from pyparsing import ParserElement
 
 # isort: FIRSTPARTY
 from dbus_signature_pyparsing import Parser
@@ -32,33 +33,40 @@ from hs_dbus_signature import dbus_signatures
 from into_dbus_python import signature, xformer, xformers
 from into_dbus_python._errors import IntoDPUnexpectedValueError
 
+# All default phases except explain, which is slow when generating
+# examples is slow, as it is for nested variant values.
+_PHASES = (Phase.explicit, Phase.reuse, Phase.generate, Phase.target, Phase.shrink)
+
+# Generating nested values is slow, and slower still under tracing or
+# coverage, so deadlines and the corresponding health checks are disabled.
+settings.register_profile(
+    "dev",
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+    phases=_PHASES,
+)
+# CI selects this profile, so that its examples are the same on every run.
 settings.register_profile(
-    "tracing", deadline=None, suppress_health_check=[HealthCheck.too_slow]
+    "ci-fast", parent=settings.get_profile("dev"), derandomize=True
 )
-if sys.gettrace() is not None:
-    settings.load_profile("tracing")
+settings.register_profile("deep", parent=settings.get_profile("dev"))
+_PROFILE = os.environ.get("HYPOTHESIS_PROFILE", "dev")
+settings.load_profile(_PROFILE)
+
+# Memoize parsing of the many signatures generated, unless a memory
+# constrained environment disables it by setting PYPARSING_PACKRAT to 0.
+if os.environ.get("PYPARSING_PACKRAT") != "0":
+    ParserElement.enablePackrat(None)
 
 # Omits h, unix fd, because it is unclear what are valid fds for dbus
-SIGNATURE_STRATEGY = dbus_signatures(max_codes=20, blacklist="h")
-
-OBJECT_PATH_STRATEGY = strategies.builds(
-    "/".__add__,
-    strategies.builds(
-        "/".join,
-        strategies.lists(
-            strategies.text(
-                alphabet=list(
-                    string.digits
-                    + string.ascii_uppercase
-                    + string.ascii_lowercase
-                    + "_"
-                ),
-                min_size=1,
-                max_size=10,
-            ),
-            max_size=10,
-        ),
-    ),
+# Small signature values suffice, except when running the "deep" profile
+SIGNATURE_STRATEGY = dbus_signatures(
+    max_codes=20 if _PROFILE == "deep" else 5, blacklist="h"
+)
+
+# Either the root path, or up to ten non-empty elements each preceded by "/"
+OBJECT_PATH_STRATEGY = strategies.from_regex(
+    r"/|(/[0-9A-Za-z_]{1,10}){1,10}", fullmatch=True
 )
 
 
@@ -120,6 +128,17 @@ class StrategyGenerator(Parser):
         self.OBJECT_PATH.setParseAction(lambda: OBJECT_PATH_STRATEGY)
         self.SIGNATURE.setParseAction(lambda: SIGNATURE_STRATEGY)
 
+        @functools.lru_cache(maxsize=1024)
+        def _parse_complete(sig):
+            """
+            Get the strategy for a signature of a single complete type.
+
+            :param str sig: the signature
+            :returns: strategy that generates an object of the signature
+            :rtype: strategy
+            """
+            return self.COMPLETE.parseString(sig)[0]
+
         def _handle_variant():
             """
             Generate the correct strategy for a variant signature.
@@ -135,9 +154,7 @@ class StrategyGenerator(Parser):
                 blacklist="h",
             )
             return signature_strategy.flatmap(
-                lambda x: strategies.tuples(
-                    strategies.just(x), self.COMPLETE.parseString(x)[0]
-                )
+                lambda x: strategies.tuples(strategies.just(x), _parse_complete(x))
             )
 
         self.VARIANT.setParseAction(_handle_variant)
@@ -164,7 +181,6 @@ class ParseTestCase(unittest.TestCase):
             )
         )
     )
-    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
     def test_parsing(self, strat):
         """
         Test that parsing is always successful.
@@ -194,9 +210,7 @@ class ParseTestCase(unittest.TestCase):
             )
         )
     )
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.too_slow], deadline=None
-    )
+    @settings(max_examples=10)
     def test_struct(self, strat):
         """
         Test exception throwing on a struct signature when number of items